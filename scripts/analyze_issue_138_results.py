@@ -4,168 +4,650 @@ Analyze Issue #138 validation test results
 Checks for common failure indicators in partition/healing scenarios
 """
 
+from __future__ import annotations
+
 import sys
 import os
 import csv
 import argparse
+import importlib
+import importlib.machinery
+import importlib.util
+from contextlib import ExitStack
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Final, Iterator, Optional, Sequence
+
+# The optional backends (polars, numpy, pandas, pyarrow, numba) are
+# imported by the functions that use them, so a run only pays for the
+# backend it picks; see has_backend() and _load_results()
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+@lru_cache(maxsize=None)
+def has_backend(module: str) -> bool:
+    """Whether an optional dependency can be imported (importing it if so)"""
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        return False
+    return True
 
 class Colors:
     """ANSI color codes for terminal output"""
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    NC = '\033[0m'  # No Color
-
-def load_csv(csv_path: Path) -> List[Dict]:
-    """Load CSV file into list of dictionaries"""
-    if not csv_path.exists():
-        return []
-    
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
-
-def check_bridge_count(data: List[Dict], scenario: str) -> Tuple[bool, List[str]]:
+    RED: Final = '\033[0;31m'
+    GREEN: Final = '\033[0;32m'
+    YELLOW: Final = '\033[1;33m'
+    BLUE: Final = '\033[0;34m'
+    NC: Final = '\033[0m'  # No Color
+
+# Status prefixes for report lines
+PASS = f"{Colors.GREEN}✓ "
+FAIL = f"{Colors.RED}✗ "
+
+# Report headings for each check, as (failed, passed)
+CHECK_HEADINGS = (
+    (f"{FAIL}Multiple bridges detected:{Colors.NC}", f"{PASS}Bridge count correct{Colors.NC}"),
+    (f"{FAIL}Low message delivery rate:{Colors.NC}", f"{PASS}Message delivery good{Colors.NC}"),
+    (f"{FAIL}Isolated nodes detected:{Colors.NC}", f"{PASS}No isolated nodes{Colors.NC}"),
+)
+
+# Columns compared numerically by the checks
+NUMERIC_COLUMNS = (
+    'partition_count',
+    'active_bridge_count',
+    'message_delivery_rate',
+    'isolated_node_count',
+    'unreachable_nodes',
+)
+
+# Node and bridge counts; every backend only accepts what int() parses
+COUNT_COLUMNS = (
+    'active_bridge_count',
+    'isolated_node_count',
+    'unreachable_nodes',
+)
+
+# Columns read by the checks
+INSPECTED_COLUMNS = ('time',) + NUMERIC_COLUMNS
+
+# Where result files are looked up in the results directory, in order of
+# preference: <scenario>/metrics.<ext>, then <scenario>.<ext>
+RESULT_PATTERNS = ('*/metrics.*', '*.*')
+
+# CSVs smaller than this are read with the csv module (see _load_results)
+SMALL_CSV_BYTES = 4 * 1024 * 1024
+
+def load_soa(csv_path: Path, healed_only: bool = False) -> tuple[int, dict[str, tuple[str, ...]]]:
+    """Load the inspected columns of a CSV file, one tuple of strings per column
+    
+    Uses csv.reader instead of DictReader so no dict is built per row.
+    Returns the number of data rows and the inspected columns present in
+    the header. Cells missing from short rows read as empty strings, like
+    the nulls polars fills in. With healed_only, rows whose partition_count
+    is not '1' are skipped.
+    """
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        names = [c for c in INSPECTED_COLUMNS if c in header]
+        indices = [header.index(c) for c in names]
+        if not names:
+            return sum(1 for row in reader if row), {}
+        
+        padding = [''] * (max(indices) + 1)
+        getter: Callable[[list[str]], tuple[str, ...]]
+        if len(indices) == 1:
+            index = indices[0]
+            getter = lambda row: (row[index],)
+        else:
+            getter = itemgetter(*indices)
+        
+        row_count: int = 0
+        values: list[tuple[str, ...]] = []
+        if healed_only and 'partition_count' in names:
+            partition_index = header.index('partition_count')
+            for row in reader:
+                if not row:
+                    continue  # Blank line, skipped by DictReader as well
+                row_count += 1
+                if len(row) < len(padding):
+                    row += padding[len(row):]
+                if row[partition_index] == '1':
+                    values.append(getter(row))
+        else:
+            for row in reader:
+                if not row:
+                    continue  # Blank line, skipped by DictReader as well
+                row_count += 1
+                if len(row) < len(padding):
+                    row += padding[len(row):]
+                values.append(getter(row))
+    
+    # One pass per column is much cheaper than transposing with zip(*values)
+    return row_count, {
+        name: tuple(map(itemgetter(position), values))
+        for position, name in enumerate(names)
+    }
+
+def to_float_array(values: Sequence[str]) -> np.ndarray:
+    """Convert a string column to float, using NaN for unparseable cells"""
+    import numpy as np
+    
+    try:
+        # Parses the strings directly, without an intermediate str array
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        if has_backend('pandas'):  # Optional: vectorized coercion
+            import pandas as pd
+            return pd.to_numeric(values, errors='coerce').astype(np.float64)
+        out = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except ValueError:
+                pass
+        return out
+
+def to_count_array(values: Sequence[str]) -> np.ndarray:
+    """Convert a string count column to float, using NaN where int() fails
+    
+    Unlike to_float_array, cells such as '2.5', '2.0' or '1e1' are
+    unparseable, as they are for the stdlib and polars checks.
+    """
+    import numpy as np
+    
+    try:
+        # Integer parsing accepts exactly what int() accepts
+        return np.array(values, dtype=np.int64).astype(np.float64)
+    except (ValueError, OverflowError):
+        out = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                out[i] = int(value)
+            except ValueError:
+                pass
+        return out
+
+def read_header(csv_path: Path) -> list[str]:
+    """Read the column names from the first line of a CSV file"""
+    with open(csv_path, 'r', newline='') as f:
+        return next(csv.reader(f), [])
+
+def load_columns(csv_path: Path) -> tuple[int, dict[str, np.ndarray]]:
+    """Load the unified mesh rows of a CSV file into NumPy column arrays
+    
+    Returns the number of data rows and a dict of the other columns used by
+    the checks, restricted to partition_count == 1 rows: numeric columns as
+    float arrays (NaN where unparseable, see to_count_array for counts)
+    and 'time' as strings, so it is reported exactly as written in the CSV.
+    """
+    import numpy as np
+    
+    # Only unified mesh rows are checked, so only those are kept and
+    # converted. Comparing the raw strings avoids parsing partition_count.
+    row_count, soa = load_soa(csv_path, healed_only=True)
+    if 'partition_count' not in soa:
+        return row_count, {}
+    
+    columns: dict[str, np.ndarray] = {}
+    for name, values in soa.items():
+        if name == 'partition_count':
+            continue
+        if name == 'time':
+            columns[name] = np.array(values, dtype=str)
+        elif name in COUNT_COLUMNS:
+            columns[name] = to_count_array(values)
+        else:
+            columns[name] = to_float_array(values)
+    
+    return row_count, columns
+
+def load_arrow_columns(csv_path: Path) -> tuple[int, dict[str, np.ndarray]]:
+    """Load CSV file into NumPy column arrays using pyarrow's CSV reader
+    
+    Same result as load_columns, but parsed by pyarrow's multithreaded
+    block reader.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+    
+    header = read_header(csv_path)
+    names = [c for c in ('time',) + NUMERIC_COLUMNS if c in header]
+    if not names:
+        return load_columns(csv_path)
+    
+    column_types = {name: pa.float64() for name in NUMERIC_COLUMNS}
+    # Counts must be integers, as in to_count_array; anything else
+    # raises ArrowInvalid and takes the load_columns fallback below
+    column_types.update({name: pa.int64() for name in COUNT_COLUMNS})
+    # Like load_columns, only a literal '1' marks a unified mesh row
+    column_types['partition_count'] = pa.string()
+    column_types['time'] = pa.string()
+    try:
+        table = pacsv.read_csv(
+            csv_path,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                include_columns=names,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # A cell that does not parse as its column type (or a ragged row);
+        # the NumPy parser turns those into NaN instead of failing
+        return load_columns(csv_path)
+    
+    if 'partition_count' not in names:
+        return table.num_rows, {}
+    
+    healed = table.filter(pc.equal(table.column('partition_count'), '1'))
+    
+    columns: dict[str, np.ndarray] = {}
+    for name in names:
+        if name == 'partition_count':
+            continue
+        column = healed.column(name).to_numpy(zero_copy_only=False)
+        # Nulls come out as NaN once the counts are converted to float
+        columns[name] = column if name == 'time' else column.astype(np.float64)
+    
+    return table.num_rows, columns
+
+def load_lazy(csv_path: Path) -> pl.LazyFrame:
+    """Scan CSV (or Parquet) file lazily with polars (nothing is read until collect)"""
+    import polars as pl
+    
+    if csv_path.suffix == '.parquet':
+        return pl.scan_parquet(csv_path)
+    return pl.scan_csv(
+        csv_path,
+        infer_schema_length=1000,
+        # Unparseable cells become null. 'time' stays a string so it is
+        # reported exactly as written in the CSV, and so does
+        # partition_count: only a literal '1' marks a unified mesh row.
+        schema_overrides={
+            'time': pl.Utf8,
+            'partition_count': pl.Utf8,
+            'active_bridge_count': pl.Int64,
+            'message_delivery_rate': pl.Float64,
+            'isolated_node_count': pl.Int64,
+            'unreachable_nodes': pl.Int64,
+        },
+        ignore_errors=True,
+        # Rows with extra fields keep their leading cells, as with csv.reader
+        truncate_ragged_lines=True,
+    )
+
+def load_healed(csv_path: Path) -> tuple[int, pl.DataFrame]:
+    """Load the unified mesh rows of a CSV file with polars' streaming engine
+    
+    Returns the total number of data rows and a frame holding only the
+    partition_count == 1 rows and the columns inspected by the checks, so
+    memory stays bounded regardless of the CSV size.
+    """
+    import polars as pl
+    
+    lf = load_lazy(csv_path)
+    names = lf.collect_schema().names()
+    # Blank lines come through as all-null rows; csv.DictReader skips them
+    total = lf.filter(~pl.all_horizontal(pl.all().is_null())).select(pl.len())
+    if 'partition_count' not in names:
+        return total.collect(engine='streaming').item(), pl.DataFrame()
+    
+    keep = [c for c in ('time',) + NUMERIC_COLUMNS if c in names and c != 'partition_count']
+    # The cast covers Parquet files converted while partition_count was
+    # still read as Int64
+    healed = lf.filter(pl.col('partition_count').cast(pl.Utf8) == '1').select(keep)
+    count, frame = pl.collect_all([total, healed], engine='streaming')
+    
+    return count.item(), frame
+
+def check_bridge_count_frame(df: pl.DataFrame) -> tuple[bool, list[str]]:
+    """Check bridge count on pre-filtered unified mesh rows"""
+    import polars as pl
+    
+    if 'active_bridge_count' not in df.columns:
+        return True, []
+    
+    bridge_count = pl.col('active_bridge_count')
+    bad = df.filter((bridge_count > 1) | (bridge_count == 0))
+    
+    issues: list[str] = []
+    for row in bad.iter_rows(named=True):
+        time = row.get('time', 'unknown')
+        if row['active_bridge_count'] > 1:
+            issues.append(
+                f"  Time {time}s: {row['active_bridge_count']} bridges active (expected 1)"
+            )
+        else:
+            issues.append(
+                f"  Time {time}s: No bridge active (expected 1)"
+            )
+    
+    return not issues, issues
+
+def check_message_delivery_frame(df: pl.DataFrame) -> tuple[bool, list[str]]:
+    """Check message delivery rate on pre-filtered unified mesh rows"""
+    import polars as pl
+    
+    if 'message_delivery_rate' not in df.columns:
+        return True, []
+    
+    bad = df.filter(pl.col('message_delivery_rate') < 0.95)
+    
+    issues = [
+        f"  Time {row.get('time', 'unknown')}s: Low delivery rate "
+        f"{row['message_delivery_rate']:.2%} (expected >95%)"
+        for row in bad.iter_rows(named=True)
+    ]
+    
+    return not issues, issues
+
+def check_isolated_nodes_frame(df: pl.DataFrame) -> tuple[bool, list[str]]:
+    """Check isolated nodes on pre-filtered unified mesh rows"""
+    import polars as pl
+    
+    predicates = [pl.col(c) > 0 for c in ('isolated_node_count', 'unreachable_nodes') if c in df.columns]
+    if not predicates:
+        return True, []
+    
+    bad = df.filter(pl.any_horizontal(predicates))
+    
+    issues: list[str] = []
+    for row in bad.iter_rows(named=True):
+        time = row.get('time', 'unknown')
+        isolated = row.get('isolated_node_count')
+        if isolated is not None and isolated > 0:
+            issues.append(
+                f"  Time {time}s: {isolated} nodes isolated (expected 0)"
+            )
+        unreachable = row.get('unreachable_nodes')
+        if unreachable is not None and unreachable > 0:
+            issues.append(
+                f"  Time {time}s: {unreachable} nodes unreachable (expected 0)"
+            )
+    
+    return not issues, issues
+
+def run_all_checks_frame(df: pl.DataFrame, fail_fast: bool = False) -> tuple[list[str], list[str], list[str], tuple[bool, bool, bool]]:
+    """Run all checks on a polars frame (polars version of run_all_checks)"""
+    bridge_passed, bridge_issues = check_bridge_count_frame(df)
+    if fail_fast and not bridge_passed:
+        return bridge_issues, [], [], (False, True, True)
+    
+    delivery_passed, delivery_issues = check_message_delivery_frame(df)
+    if fail_fast and not delivery_passed:
+        return bridge_issues, delivery_issues, [], (True, False, True)
+    
+    isolated_passed, isolated_issues = check_isolated_nodes_frame(df)
+    
+    return (bridge_issues, delivery_issues, isolated_issues,
+            (bridge_passed, delivery_passed, isolated_passed))
+
+def time_label(time: Optional[np.ndarray], i: int) -> str:
+    """Time of row i as written in the CSV, or 'unknown' without a time column"""
+    return time[i] if time is not None else 'unknown'
+
+def check_bridge_count(active_bridge_count: np.ndarray,
+                       time: Optional[np.ndarray]) -> tuple[bool, list[str]]:
     """Check if bridge count is correct (should be 1 after healing)"""
-    issues = []
-    passed = True
-    
-    for row in data:
-        # Look for healed/unified states
-        if 'partition_count' in row and row['partition_count'] == '1':
-            if 'active_bridge_count' in row:
-                bridge_count = int(row['active_bridge_count'])
+    from issue_138_kernels import bad_bridge_rows
+    
+    issues: list[str] = []
+    for i in bad_bridge_rows(active_bridge_count).tolist():
+        if active_bridge_count[i] > 1:
+            issues.append(
+                f"  Time {time_label(time, i)}s: {int(active_bridge_count[i])} bridges active (expected 1)"
+            )
+        else:
+            issues.append(
+                f"  Time {time_label(time, i)}s: No bridge active (expected 1)"
+            )
+    
+    return not issues, issues
+
+def check_message_delivery(message_delivery_rate: np.ndarray,
+                           time: Optional[np.ndarray]) -> tuple[bool, list[str]]:
+    """Check if message delivery rate is high in unified mesh"""
+    from issue_138_kernels import low_delivery_rows
+    
+    issues = [
+        f"  Time {time_label(time, i)}s: Low delivery rate "
+        f"{message_delivery_rate[i]:.2%} (expected >95%)"
+        for i in low_delivery_rows(message_delivery_rate).tolist()
+    ]
+    
+    return not issues, issues
+
+def check_isolated_nodes(isolated_node_count: np.ndarray, unreachable_nodes: np.ndarray,
+                         time: Optional[np.ndarray]) -> tuple[bool, list[str]]:
+    """Check if any nodes remain isolated after healing"""
+    from issue_138_kernels import isolated_rows
+    
+    issues: list[str] = []
+    for i in isolated_rows(isolated_node_count, unreachable_nodes).tolist():
+        if isolated_node_count[i] > 0:
+            issues.append(
+                f"  Time {time_label(time, i)}s: {int(isolated_node_count[i])} nodes isolated (expected 0)"
+            )
+        if unreachable_nodes[i] > 0:
+            issues.append(
+                f"  Time {time_label(time, i)}s: {int(unreachable_nodes[i])} nodes unreachable (expected 0)"
+            )
+    
+    return not issues, issues
+
+def run_all_checks_columns(cols: dict[str, np.ndarray], fail_fast: bool = False) -> tuple[list[str], list[str], list[str], tuple[bool, bool, bool]]:
+    """Run all checks with vectorized masks (NumPy version of run_all_checks)
+    
+    cols holds only the unified mesh rows (see load_columns); it is empty
+    when the CSV has no partition_count or no other inspected column.
+    """
+    import numpy as np
+    
+    if not cols:
+        return [], [], [], (True, True, True)
+    
+    time = cols.get('time')
+    
+    # NaN compares False, so unparseable cells never raise an issue
+    with np.errstate(invalid='ignore'):
+        bridge_passed: bool = True
+        bridge_issues: list[str] = []
+        if 'active_bridge_count' in cols:
+            bridge_passed, bridge_issues = check_bridge_count(
+                cols['active_bridge_count'], time)
+            if fail_fast and not bridge_passed:
+                return bridge_issues, [], [], (False, True, True)
+        
+        delivery_passed: bool = True
+        delivery_issues: list[str] = []
+        if 'message_delivery_rate' in cols:
+            delivery_passed, delivery_issues = check_message_delivery(
+                cols['message_delivery_rate'], time)
+            if fail_fast and not delivery_passed:
+                return bridge_issues, delivery_issues, [], (True, False, True)
+        
+        # A missing column counts as zero nodes
+        no_nodes = np.zeros(len(next(iter(cols.values()))))
+        isolated_passed, isolated_issues = check_isolated_nodes(
+            cols.get('isolated_node_count', no_nodes),
+            cols.get('unreachable_nodes', no_nodes),
+            time,
+        )
+    
+    return (bridge_issues, delivery_issues, isolated_issues,
+            (bridge_passed, delivery_passed, isolated_passed))
+
+def run_all_checks(cols: dict[str, Sequence[str]], fail_fast: bool = False) -> tuple[list[str], list[str], list[str], tuple[bool, bool, bool]]:
+    """Run bridge count, message delivery and isolated node checks in one pass
+    
+    Only healed/unified states (partition_count == 1) are inspected:
+    - bridge count should be exactly 1
+    - message delivery rate should be at least 95%
+    - no nodes should remain isolated or unreachable
+    
+    The checks share a single pass over the rows, so fail_fast cannot skip
+    any work here; it is accepted for parity with the other backends.
+    """
+    bridge_issues: list[str] = []
+    delivery_issues: list[str] = []
+    isolated_issues: list[str] = []
+    
+    if 'partition_count' not in cols:
+        return bridge_issues, delivery_issues, isolated_issues, (True, True, True)
+    
+    times = cols.get('time')
+    bridge_counts = cols.get('active_bridge_count')
+    delivery_rates = cols.get('message_delivery_rate')
+    isolated_counts = cols.get('isolated_node_count')
+    unreachable_counts = cols.get('unreachable_nodes')
+    
+    for i, partition_count in enumerate(cols['partition_count']):
+        if partition_count != '1':
+            continue
+        time = times[i] if times is not None else 'unknown'
+        
+        if bridge_counts is not None:
+            try:
+                bridge_count = int(bridge_counts[i])
                 if bridge_count > 1:
-                    time = row.get('time', 'unknown')
-                    issues.append(
+                    bridge_issues.append(
                         f"  Time {time}s: {bridge_count} bridges active (expected 1)"
                     )
-                    passed = False
                 elif bridge_count == 0:
-                    time = row.get('time', 'unknown')
-                    issues.append(
+                    bridge_issues.append(
                         f"  Time {time}s: No bridge active (expected 1)"
                     )
-                    passed = False
+            except ValueError:
+                pass
+        
+        if delivery_rates is not None:
+            try:
+                delivery_rate = float(delivery_rates[i])
+                if delivery_rate < 0.95:  # Less than 95%
+                    delivery_issues.append(
+                        f"  Time {time}s: Low delivery rate {delivery_rate:.2%} (expected >95%)"
+                    )
+            except ValueError:
+                pass
+        
+        if isolated_counts is not None:
+            try:
+                isolated = int(isolated_counts[i])
+                if isolated > 0:
+                    isolated_issues.append(
+                        f"  Time {time}s: {isolated} nodes isolated (expected 0)"
+                    )
+            except ValueError:
+                pass
+        
+        if unreachable_counts is not None:
+            try:
+                unreachable = int(unreachable_counts[i])
+                if unreachable > 0:
+                    isolated_issues.append(
+                        f"  Time {time}s: {unreachable} nodes unreachable (expected 0)"
+                    )
+            except ValueError:
+                pass
     
-    return passed, issues
+    return (bridge_issues, delivery_issues, isolated_issues,
+            (not bridge_issues, not delivery_issues, not isolated_issues))
 
-def check_message_delivery(data: List[Dict], scenario: str) -> Tuple[bool, List[str]]:
-    """Check if message delivery rate is high in unified mesh"""
-    issues = []
-    passed = True
-    
-    for row in data:
-        # Look for unified mesh states
-        if 'partition_count' in row and row['partition_count'] == '1':
-            if 'message_delivery_rate' in row:
-                try:
-                    delivery_rate = float(row['message_delivery_rate'])
-                    if delivery_rate < 0.95:  # Less than 95%
-                        time = row.get('time', 'unknown')
-                        issues.append(
-                            f"  Time {time}s: Low delivery rate {delivery_rate:.2%} (expected >95%)"
-                        )
-                        passed = False
-                except ValueError:
-                    pass
-    
-    return passed, issues
-
-def check_isolated_nodes(data: List[Dict], scenario: str) -> Tuple[bool, List[str]]:
-    """Check if any nodes remain isolated after healing"""
-    issues = []
-    passed = True
-    
-    for row in data:
-        # Look for healed states
-        if 'partition_count' in row and row['partition_count'] == '1':
-            if 'isolated_node_count' in row:
-                try:
-                    isolated = int(row['isolated_node_count'])
-                    if isolated > 0:
-                        time = row.get('time', 'unknown')
-                        issues.append(
-                            f"  Time {time}s: {isolated} nodes isolated (expected 0)"
-                        )
-                        passed = False
-                except ValueError:
-                    pass
-            
-            if 'unreachable_nodes' in row:
-                try:
-                    unreachable = int(row['unreachable_nodes'])
-                    if unreachable > 0:
-                        time = row.get('time', 'unknown')
-                        issues.append(
-                            f"  Time {time}s: {unreachable} nodes unreachable (expected 0)"
-                        )
-                        passed = False
-                except ValueError:
-                    pass
-    
-    return passed, issues
-
-def analyze_scenario(csv_path: Path, scenario_name: str) -> bool:
-    """Analyze a single scenario's results"""
-    print(f"\n{Colors.BLUE}Analyzing: {scenario_name}{Colors.NC}")
-    
-    if not csv_path.exists():
-        print(f"{Colors.RED}✗ FAIL: Results CSV not found{Colors.NC}")
-        return False
+@lru_cache(maxsize=16)
+def _load_results(path_str: str, mtime_ns: int) -> tuple[int, object, Callable]:
+    """Parse a results CSV with the fastest available backend (cached)
     
-    data = load_csv(csv_path)
+    The modification time is part of the cache key, so a rewritten CSV is
+    parsed again. Cached values are shared between callers and must not be
+    modified.
+    """
+    csv_path = Path(path_str)
     
-    if not data:
-        print(f"{Colors.RED}✗ FAIL: Empty or invalid CSV{Colors.NC}")
-        return False
+    # For small CSVs the csv module finishes before polars or NumPy would
+    # even be imported
+    small = csv_path.suffix == '.csv' and csv_path.stat().st_size < SMALL_CSV_BYTES
     
-    print(f"  Loaded {len(data)} data points")
+    if not small and has_backend('polars'):
+        import polars as pl
+        try:
+            row_count, frame = load_healed(csv_path)
+        except pl.exceptions.NoDataError:
+            return 0, None, run_all_checks_frame
+        return row_count, frame, run_all_checks_frame
     
-    # Run checks
-    all_passed = True
+    if not small and has_backend('numpy'):
+        loader = load_arrow_columns if has_backend('pyarrow.csv') else load_columns
+        row_count, columns = loader(csv_path)
+        for column in columns.values():
+            column.flags.writeable = False
+        return row_count, columns, run_all_checks_columns
     
-    # Check 1: Bridge count
-    bridge_passed, bridge_issues = check_bridge_count(data, scenario_name)
-    if not bridge_passed:
-        all_passed = False
-        print(f"{Colors.RED}✗ Multiple bridges detected:{Colors.NC}")
-        for issue in bridge_issues:
-            print(issue)
-    else:
-        print(f"{Colors.GREEN}✓ Bridge count correct{Colors.NC}")
-    
-    # Check 2: Message delivery
-    delivery_passed, delivery_issues = check_message_delivery(data, scenario_name)
-    if not delivery_passed:
-        all_passed = False
-        print(f"{Colors.RED}✗ Low message delivery rate:{Colors.NC}")
-        for issue in delivery_issues:
-            print(issue)
-    else:
-        print(f"{Colors.GREEN}✓ Message delivery good{Colors.NC}")
-    
-    # Check 3: Isolated nodes
-    isolated_passed, isolated_issues = check_isolated_nodes(data, scenario_name)
-    if not isolated_passed:
-        all_passed = False
-        print(f"{Colors.RED}✗ Isolated nodes detected:{Colors.NC}")
-        for issue in isolated_issues:
-            print(issue)
-    else:
-        print(f"{Colors.GREEN}✓ No isolated nodes{Colors.NC}")
+    row_count, soa = load_soa(csv_path)
+    return row_count, soa, run_all_checks
+
+def load_results(csv_path: Path, use_cache: bool = True) -> tuple[int, object, Callable]:
+    """Load a results CSV, reusing the parsed data while the file is unchanged
+    
+    Returns the number of data rows, the loaded data and the function that
+    runs all checks on it. The cache only helps callers that analyze the
+    same file more than once in a process; the CLI parses each scenario
+    once.
+    """
+    path_str = str(csv_path)
+    mtime_ns = csv_path.stat().st_mtime_ns
+    if not use_cache:
+        return _load_results.__wrapped__(path_str, mtime_ns)
+    return _load_results(path_str, mtime_ns)
+
+def analyze_scenario(csv_path: Path, scenario_name: str, use_cache: bool = True,
+                     fail_fast: bool = False) -> tuple[bool, str]:
+    """Analyze a single scenario's results
+    
+    Returns whether all checks passed and the report text. The report is
+    built in memory so it can be written in one go, without interleaving
+    output from scenarios analyzed in parallel. With fail_fast, checks
+    after the first failing one are skipped and left out of the report.
+    """
+    parts: list[str] = [f"\n{Colors.BLUE}Analyzing: {scenario_name}{Colors.NC}"]
+    
+    try:
+        row_count, data, run_checks = load_results(csv_path, use_cache)
+    except FileNotFoundError:
+        parts.append(f"{FAIL}FAIL: Results CSV not found{Colors.NC}")
+        return False, "\n".join(parts) + "\n"
+    
+    if not row_count:
+        parts.append(f"{FAIL}FAIL: Empty or invalid CSV{Colors.NC}")
+        return False, "\n".join(parts) + "\n"
+    
+    parts.append(f"  Loaded {row_count} data points")
+    
+    # Run checks: bridge count, message delivery, isolated nodes
+    *issue_lists, passed_flags = run_checks(data, fail_fast)
+    all_passed = all(passed_flags)
+    
+    for issues, passed, (failed_heading, passed_heading) in zip(issue_lists, passed_flags, CHECK_HEADINGS):
+        if passed:
+            parts.append(passed_heading)
+        else:
+            parts.append(failed_heading)
+            parts.extend(issues)
+            if fail_fast:
+                break
     
     if all_passed:
-        print(f"{Colors.GREEN}✓ All checks PASSED{Colors.NC}")
+        parts.append(f"{PASS}All checks PASSED{Colors.NC}")
     else:
-        print(f"{Colors.RED}✗ Some checks FAILED{Colors.NC}")
+        parts.append(f"{FAIL}Some checks FAILED{Colors.NC}")
     
-    return all_passed
+    return all_passed, "\n".join(parts) + "\n"
 
-def main():
+def main() -> int:
     parser = argparse.ArgumentParser(
         description="Analyze Issue #138 validation test results"
     )
@@ -174,6 +656,23 @@ def main():
         type=Path,
         help='Directory containing test results'
     )
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Prefer metrics.parquet over metrics.csv (see convert_metrics_to_parquet.py)'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop checking a scenario at its first failing check'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Analyze up to N scenarios in parallel worker processes '
+             '(default: 1, analyze in this process)'
+    )
     
     args = parser.parse_args()
     
@@ -181,6 +680,10 @@ def main():
         print(f"{Colors.RED}Error: Results directory not found: {args.results_dir}{Colors.NC}")
         return 1
     
+    if args.parquet and not has_backend('polars'):
+        print(f"{Colors.RED}Error: --parquet requires polars (pip install polars){Colors.NC}")
+        return 1
+    
     print(f"{Colors.BLUE}========================================{Colors.NC}")
     print(f"{Colors.BLUE}Issue #138 Results Analysis{Colors.NC}")
     print(f"{Colors.BLUE}========================================{Colors.NC}")
@@ -195,23 +698,58 @@ def main():
         'cascade_healing': 'issue_138_cascade_healing',
     }
     
-    passed_count = 0
-    failed_count = 0
+    passed_count: int = 0
+    failed_count: int = 0
+    
+    # Index result files with two one-level globs instead of probing each
+    # candidate path. Lookup order per scenario follows RESULT_PATTERNS,
+    # and Parquet comes before CSV with --parquet.
+    extensions = ('.parquet', '.csv') if args.parquet else ('.csv',)
+    ranked: dict[str, tuple[tuple[int, int], Path]] = {}
+    for location, pattern in enumerate(RESULT_PATTERNS):
+        for path in args.results_dir.glob(pattern):
+            if path.suffix not in extensions:
+                continue
+            name = path.parent.name if location == 0 else path.stem
+            rank = (location, extensions.index(path.suffix))
+            if name not in ranked or rank < ranked[name][0]:
+                ranked[name] = (rank, path)
+    result_files = {name: path for name, (rank, path) in ranked.items()}
     
-    for scenario_key, scenario_name in scenarios.items():
-        # Look for metrics CSV
-        csv_path = args.results_dir / scenario_name / 'metrics.csv'
-        if not csv_path.exists():
-            # Try alternative locations
-            csv_path = args.results_dir / f'{scenario_name}.csv'
+    jobs = [(result_files.get(scenario_name), scenario_name) for scenario_name in scenarios.values()]
+    paths = [csv_path for csv_path, _ in jobs if csv_path is not None]
+    names = [scenario_name for csv_path, scenario_name in jobs if csv_path is not None]
+    analyze = partial(analyze_scenario, fail_fast=args.fail_fast)
+    
+    with ExitStack() as stack:
+        results: Iterator[tuple[bool, str]]
+        if args.jobs > 1 and len(paths) > 1:
+            # Scenarios are independent, so they can be checked in parallel.
+            # Each worker is a fresh interpreter that re-imports its backend,
+            # which only pays off for large results. Use 'spawn' since
+            # polars' thread pool is not fork-safe.
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=min(args.jobs, len(paths)),
+                mp_context=multiprocessing.get_context('spawn'),
+            ))
+            results = executor.map(analyze, paths, names)
+        else:
+            results = map(analyze, paths, names)
         
-        if csv_path.exists():
-            if analyze_scenario(csv_path, scenario_name):
+        # Report in scenario order regardless of completion order
+        for csv_path, scenario_name in jobs:
+            if csv_path is None:
+                print(f"\n{Colors.YELLOW}⚠ SKIP: {scenario_name} (no results found){Colors.NC}")
+                continue
+            
+            passed, report = next(results)
+            sys.stdout.write(report)
+            if passed:
                 passed_count += 1
             else:
                 failed_count += 1
-        else:
-            print(f"\n{Colors.YELLOW}⚠ SKIP: {scenario_name} (no results found){Colors.NC}")
     
     # Summary
     print(f"\n{Colors.BLUE}========================================{Colors.NC}")
@@ -235,4 +773,13 @@ def main():
         return 1
 
 if __name__ == '__main__':
+    # With ISSUE_138_COMPILED=1, run the mypyc-compiled extension built next
+    # to this file (see setup_mypyc.py), unless this file is newer than it
+    spec = importlib.util.find_spec('analyze_issue_138_results')
+    if (os.environ.get('ISSUE_138_COMPILED') == '1' and spec is not None
+            and isinstance(spec.loader, importlib.machinery.ExtensionFileLoader)):
+        if os.path.getmtime(spec.loader.path) >= os.path.getmtime(__file__):
+            sys.exit(importlib.import_module(spec.name).main())
+        print(f"{Colors.YELLOW}Warning: compiled analyzer is older than "
+              f"{Path(__file__).name}, running interpreted{Colors.NC}", file=sys.stderr)
     sys.exit(main())
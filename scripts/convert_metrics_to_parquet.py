@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Convert Issue #138 metrics CSVs to Parquet
+Lets analyze_issue_138_results.py --parquet skip CSV parsing on later runs
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+
+from analyze_issue_138_results import RESULT_PATTERNS, Colors, has_backend, load_lazy
+
+def convert_csv(csv_path: Path, force: bool = False) -> bool:
+    """Write a .parquet file next to a CSV file
+    
+    Returns False if the Parquet file is already newer than the CSV.
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if (not force and parquet_path.exists()
+            and parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns):
+        return False
+    
+    # Same column types as the analyzer, so 'time' is kept verbatim.
+    # Write next to the target and rename on success, so a failed scan
+    # never leaves a partial Parquet file that looks up to date.
+    tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+    try:
+        load_lazy(csv_path).sink_parquet(tmp_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, parquet_path)
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Issue #138 metrics CSVs to Parquet"
+    )
+    parser.add_argument(
+        'results_dir',
+        type=Path,
+        help='Directory containing test results'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Convert even if an up-to-date Parquet file exists'
+    )
+    
+    args = parser.parse_args()
+    
+    if not has_backend('polars'):
+        print(f"{Colors.RED}Error: polars is required (pip install polars){Colors.NC}")
+        return 1
+    import polars as pl
+    
+    if not args.results_dir.exists():
+        print(f"{Colors.RED}Error: Results directory not found: {args.results_dir}{Colors.NC}")
+        return 1
+    
+    # Only the CSVs the analyzer can pick up, not per-node logs elsewhere
+    csv_paths = sorted({
+        path
+        for pattern in RESULT_PATTERNS
+        for path in args.results_dir.glob(pattern)
+        if path.suffix == '.csv'
+    })
+    
+    converted = 0
+    failed = 0
+    for csv_path in csv_paths:
+        try:
+            if convert_csv(csv_path, args.force):
+                converted += 1
+                print(f"{Colors.GREEN}✓ {csv_path.with_suffix('.parquet')}{Colors.NC}")
+            else:
+                print(f"  Up to date: {csv_path.with_suffix('.parquet')}")
+        except pl.exceptions.NoDataError:
+            print(f"{Colors.YELLOW}⚠ SKIP: {csv_path} (empty CSV){Colors.NC}")
+        except pl.exceptions.PolarsError as e:
+            failed += 1
+            print(f"{Colors.RED}✗ FAIL: {csv_path} ({e}){Colors.NC}")
+    
+    print(f"Converted {converted} file(s)")
+    if failed:
+        print(f"{Colors.RED}Failed: {failed} file(s){Colors.NC}")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Row selection kernels for analyze_issue_138_results.py
+Kept in a separate, never mypyc-compiled module so numba can JIT them
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: compiled row scans instead of NumPy masks
+    njit = None  # type: ignore[assignment]
+
+# Indices of the rows that fail a check. The loaders only keep unified
+# mesh rows (partition_count == 1), so every row is inspected. With numba
+# these are compiled loops scanning the columns once (cached on disk
+# across runs); otherwise NumPy boolean masks.
+if njit is not None:
+    @njit(cache=True)
+    def bad_bridge_rows(bridge_count):
+        rows = np.empty(bridge_count.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(bridge_count.shape[0]):
+            if bridge_count[i] > 1 or bridge_count[i] == 0:
+                rows[n] = i
+                n += 1
+        return rows[:n]
+    
+    @njit(cache=True)
+    def low_delivery_rows(delivery_rate):
+        rows = np.empty(delivery_rate.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(delivery_rate.shape[0]):
+            if delivery_rate[i] < 0.95:
+                rows[n] = i
+                n += 1
+        return rows[:n]
+    
+    @njit(cache=True)
+    def isolated_rows(isolated, unreachable):
+        rows = np.empty(isolated.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(isolated.shape[0]):
+            if isolated[i] > 0 or unreachable[i] > 0:
+                rows[n] = i
+                n += 1
+        return rows[:n]
+else:
+    def bad_bridge_rows(bridge_count):
+        return np.flatnonzero((bridge_count > 1) | (bridge_count == 0))
+    
+    def low_delivery_rows(delivery_rate):
+        return np.flatnonzero(delivery_rate < 0.95)
+    
+    def isolated_rows(isolated, unreachable):
+        return np.flatnonzero((isolated > 0) | (unreachable > 0))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Compile analyze_issue_138_results.py into a C extension with mypyc
+The analyzer only runs the compiled module when ISSUE_138_COMPILED=1 is
+set, and falls back to the script if it was edited after the build.
+
+Usage:
+    pip install mypy setuptools
+    python scripts/setup_mypyc.py build_ext --inplace
+    ISSUE_138_COMPILED=1 ./scripts/analyze_issue_138_results.py results/issue_138/
+"""
+
+import os
+from pathlib import Path
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+# Build in scripts/ so the extension lands next to the script it replaces
+os.chdir(Path(__file__).resolve().parent)
+
+setup(
+    name='analyze_issue_138_results',
+    # issue_138_kernels.py stays interpreted so numba can JIT its functions
+    ext_modules=mypycify([
+        '--ignore-missing-imports',
+        'analyze_issue_138_results.py',
+    ]),
+)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Parity tests for scripts/analyze_issue_138_results.py
+Every loader/runner pair must report exactly what the stdlib path reports
+
+Run with: python -m unittest discover -s test -p 'test_*.py'
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import analyze_issue_138_results as analyzer
+
+HEADER = 'time,partition_count,active_bridge_count,message_delivery_rate,isolated_node_count,unreachable_nodes\n'
+
+# Edge-case metrics CSVs, each with at least one row every backend must flag
+CASES = {
+    'clean': HEADER + (
+        '0,2,0,0.50,1,1\n'
+        '10,1,1,0.99,0,0\n'
+        '20,1,2,0.90,1,3\n'
+    ),
+    'blank_lines': HEADER + (
+        '10,1,1,0.99,0,0\n'
+        '\n'
+        '20,1,0,0.99,0,0\n'
+        '\n'
+    ),
+    'ragged_rows': HEADER + (
+        '10,1,1,0.99,0,0,extra\n'
+        '20,1,2,0.99,0,0\n'
+        '30,1,0\n'
+    ),
+    'non_numeric': HEADER + (
+        '10,1,x,0.99,0,0\n'
+        '20,1,2,n/a,0,?\n'
+        '30,1,,0.50,,1\n'
+    ),
+    'non_integral': HEADER + (
+        '10,1,2.5,0.99,0,0\n'
+        '20,1,1,0.99,0.5,0\n'
+        '30,1,1,0.99,0,1e1\n'
+        '40,1,3,0.99,0,0\n'
+    ),
+    'partition_literal': HEADER + (
+        '10,1.0,3,0.20,1,1\n'
+        '20,01,3,0.20,1,1\n'
+        '30,1,2,0.99,0,0\n'
+    ),
+    'missing_columns': (
+        'time,partition_count,active_bridge_count,isolated_node_count\n'
+        '10,1,2,0\n'
+        '20,1,1,4\n'
+    ),
+    'no_time_column': (
+        'partition_count,active_bridge_count,message_delivery_rate\n'
+        '1,2,0.5\n'
+    ),
+    'no_partition_column': (
+        'time,active_bridge_count\n'
+        '10,5\n'
+    ),
+    'header_only': HEADER,
+}
+
+def load_stdlib(csv_path):
+    row_count, soa = analyzer.load_soa(csv_path)
+    return row_count, analyzer.run_all_checks(soa)
+
+def load_numpy(csv_path):
+    row_count, columns = analyzer.load_columns(csv_path)
+    return row_count, analyzer.run_all_checks_columns(columns)
+
+def load_pyarrow(csv_path):
+    row_count, columns = analyzer.load_arrow_columns(csv_path)
+    return row_count, analyzer.run_all_checks_columns(columns)
+
+def load_polars(csv_path):
+    row_count, frame = analyzer.load_healed(csv_path)
+    return row_count, analyzer.run_all_checks_frame(frame)
+
+class BackendParityTest(unittest.TestCase):
+    """Compare each optional backend against the stdlib csv path"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.paths = {}
+        for name, text in CASES.items():
+            path = Path(cls.tmp.name) / f'{name}.csv'
+            path.write_text(text)
+            cls.paths[name] = path
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def assert_matches_stdlib(self, load):
+        for name, path in self.paths.items():
+            with self.subTest(case=name):
+                self.assertEqual(load(path), load_stdlib(path))
+
+    def test_stdlib_flags_every_case(self):
+        for name, path in self.paths.items():
+            if name in ('no_partition_column', 'header_only'):
+                continue
+            with self.subTest(case=name):
+                row_count, (*issue_lists, passed_flags) = load_stdlib(path)
+                self.assertFalse(all(passed_flags))
+
+    @unittest.skipUnless(analyzer.has_backend('numpy'), 'numpy not installed')
+    def test_numpy(self):
+        self.assert_matches_stdlib(load_numpy)
+
+    @unittest.skipUnless(analyzer.has_backend('numpy') and analyzer.has_backend('pyarrow.csv'),
+                         'numpy or pyarrow not installed')
+    def test_pyarrow(self):
+        self.assert_matches_stdlib(load_pyarrow)
+
+    @unittest.skipUnless(analyzer.has_backend('polars'), 'polars not installed')
+    def test_polars(self):
+        self.assert_matches_stdlib(load_polars)
+
+if __name__ == '__main__':
+    unittest.main()